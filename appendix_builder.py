@@ -0,0 +1,207 @@
+import logging
+import os
+import re
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from docx import Document
+from docx.shared import Pt, RGBColor
+from docx.enum.text import WD_PARAGRAPH_ALIGNMENT
+from docx.oxml.ns import qn
+from lxml.etree import SubElement
+
+# Shared code for the appendix scripts (generate_appendix.py, generate_cv_parser_code.py).
+# Each script only holds its own configuration and calls build_doc().
+
+logger = logging.getLogger(__name__)
+
+# --- CONFIGURATION ---
+
+# Threads used to read source files while the document is assembled
+READ_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+# Maximum number of files read ahead of the document being built
+READ_AHEAD = 64
+
+# Tabs and line breaks get their own run elements in Word XML
+RUN_CONTENT_SPLIT = re.compile(r'([\t\r\n])')
+
+def configure_logging():
+    """Sets up console logging for the scripts (and their worker processes) from LOG_LEVEL."""
+    # Per-file progress is logged at DEBUG; set LOG_LEVEL=DEBUG to see it
+    level = os.getenv("LOG_LEVEL", "INFO").upper()
+    if not isinstance(logging.getLevelName(level), int):
+        # Unknown level names would make basicConfig() raise (in every pool worker too)
+        level = "INFO"
+    logging.basicConfig(level=level, format="%(message)s")
+
+def _read_file(file_path):
+    """Reads a source file, returning the exception instead of raising it so the caller can report it."""
+    # Binary read and a single decode; stray non-UTF-8 bytes are replaced instead of
+    # dropping the whole file
+    try:
+        with open(file_path, 'rb') as f:
+            content = f.read().decode('utf-8', errors='replace')
+    except Exception as e:
+        return e
+    # Windows line endings become one line break, as text mode did (a lone '\r' is
+    # already a line break in the document)
+    if '\r' in content:
+        content = content.replace('\r\n', '\n')
+    return content
+
+def _iter_files(base_path, exclude_dirs, root_only=False):
+    """
+    Yields a DirEntry for every file under base_path, in the same order as os.walk.
+    Uses os.scandir directly so file/directory checks come from the cached entry
+    type instead of extra stat() calls, and excluded directories are never entered.
+    If root_only is True, subdirectories are not scanned at all.
+    """
+    subdirs = []
+    try:
+        with os.scandir(base_path) as entries:
+            for entry in entries:
+                if entry.is_dir():
+                    # Like os.walk, don't follow symlinked directories
+                    if entry.name not in exclude_dirs and not entry.is_symlink():
+                        subdirs.append(entry.path)
+                else:
+                    yield entry
+    except OSError as e:
+        logger.error("Error scanning %s: %s", base_path, e)
+        return
+
+    if not root_only:
+        for path in subdirs:
+            yield from _iter_files(path, exclude_dirs)
+
+def _source_files(base_path, include_exts, exclude_dirs, exclude_files, root_only=False):
+    """Yields the path of every file under base_path that should go into the document."""
+    # Split once so the per-file check is one endswith() and one set lookup. Only single
+    # suffixes count as extensions; every entry also matches as an exact filename
+    # (e.g. Dockerfile, or dotfiles like '.dockerignore' and '.env.example')
+    ext_suffixes = tuple(sorted(x for x in include_exts if x.startswith('.') and '.' not in x[1:]))
+    include_names = frozenset(include_exts)
+
+    for entry in _iter_files(base_path, exclude_dirs, root_only):
+        file = entry.name
+        if file in exclude_files:
+            continue
+        # Check extension or exact filename (like Dockerfile)
+        if file in include_names or file.endswith(ext_suffixes):
+            yield entry.path
+
+def _read_ahead(executor, file_paths):
+    """
+    Yields (file_path, content) in order, reading up to READ_AHEAD files ahead on the executor.
+    The window is bounded so large trees never hold every file in memory at once.
+    """
+    pending = deque()
+    for file_path in file_paths:
+        pending.append((file_path, executor.submit(_read_file, file_path)))
+        if len(pending) >= READ_AHEAD:
+            file_path, future = pending.popleft()
+            yield file_path, future.result()
+    while pending:
+        file_path, future = pending.popleft()
+        yield file_path, future.result()
+
+def _add_code_paragraph(doc, content):
+    """
+    Appends content as a single paragraph, same as doc.add_paragraph(content).
+    python-docx converts text into run XML one character at a time, which dominates
+    build time for source files; here whole text chunks go straight into lxml.
+    """
+    paragraph = doc.add_paragraph()
+    if not content:
+        return paragraph
+    r = paragraph._p.add_r()
+    for piece in RUN_CONTENT_SPLIT.split(content):
+        if piece == '\t':
+            SubElement(r, qn('w:tab'))
+        elif piece == '\n' or piece == '\r':
+            SubElement(r, qn('w:br'))
+        elif piece:
+            t = SubElement(r, qn('w:t'))
+            t.text = piece
+            # Keep leading/trailing whitespace (indentation) from being collapsed
+            if len(piece.strip()) < len(piece):
+                t.set(qn('xml:space'), 'preserve')
+    return paragraph
+
+def _new_document(title, intro, heading_size, code_size, separator_width):
+    """Creates the Word doc with its styles, title and optional intro note."""
+    doc = Document()
+
+    # Styles are shared by every paragraph that uses them, so configure them once here
+    # File path headers (Styled Dark Blue)
+    heading_style = doc.styles['Heading 2']
+    heading_style.font.color.rgb = RGBColor(0, 51, 102)
+    heading_style.font.size = Pt(heading_size)
+    # Code blocks with Courier Font
+    code_style = doc.styles['Normal']
+    code_style.font.name = 'Courier New'
+    code_style.font.size = Pt(code_size)
+
+    # Document Title
+    heading = doc.add_heading(title, 0)
+    heading.alignment = WD_PARAGRAPH_ALIGNMENT.CENTER
+
+    # Optional intro note under the title
+    if intro:
+        intro_para = doc.add_paragraph(intro)
+        intro_para.alignment = WD_PARAGRAPH_ALIGNMENT.CENTER
+        doc.add_paragraph('_' * separator_width)
+    return doc
+
+def build_doc(source_folder, output_filename, title, include_exts, exclude_dirs,
+              exclude_files=frozenset(), root_only=False, intro=None,
+              heading_size=10, code_size=8, separator_width=100):
+    """
+    Scans a folder and writes its code content to a Word doc.
+    if root_only is True, it only scans files in that directory, not subdirectories.
+    Returns the number of files written (0 if the folder is missing or has no matches).
+    """
+    base_path = os.path.join('.', source_folder)
+
+    if not os.path.isdir(base_path):
+        logger.warning("Skipping %s: Directory not found.", source_folder)
+        return 0
+
+    # The document is only created once the first matching file turns up
+    doc = None
+    files_processed = 0
+
+    # Walk through the directory, reading matching files on a thread pool while the
+    # document is built here in walk order (python-docx isn't thread-safe, so all
+    # appends stay on this thread)
+    file_paths = _source_files(base_path, include_exts, exclude_dirs, exclude_files, root_only)
+    with ThreadPoolExecutor(max_workers=READ_WORKERS) as executor:
+        for file_path, content in _read_ahead(executor, file_paths):
+            logger.debug("[%s] Adding: %s", source_folder, file_path)
+            if doc is None:
+                doc = _new_document(title, intro, heading_size, code_size, separator_width)
+
+            try:
+                # Add file path header
+                doc.add_heading(file_path, level=2)
+
+                # Reading failures come back as the exception itself
+                if isinstance(content, Exception):
+                    raise content
+
+                # Add Code Block
+                code_para = _add_code_paragraph(doc, content)
+                code_para.paragraph_format.space_after = Pt(2)
+
+                # Add Separator
+                doc.add_paragraph('_' * separator_width)
+                files_processed += 1
+
+            except Exception as e:
+                logger.error("Error reading %s: %s", file_path, e)
+
+    if files_processed > 0:
+        doc.save(output_filename)
+        logger.info("✅ Successfully created %s (%d files)", output_filename, files_processed)
+    else:
+        logger.warning("⚠️ No matching files found in %s", source_folder)
+    return files_processed
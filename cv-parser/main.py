@@ -6,14 +6,41 @@ Uses regex-based extraction for common fields.
 
 from fastapi import FastAPI, UploadFile, File, HTTPException, Form
 from fastapi.middleware.cors import CORSMiddleware
-from typing import Optional, Dict, Any, List
+from fastapi.responses import ORJSONResponse
+from typing import Optional, Dict, Any, List, Tuple
+from collections import OrderedDict
+from concurrent.futures import Executor, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import asynccontextmanager
+from functools import lru_cache
+import asyncio
+import multiprocessing
+import logging
+import threading
+import os
 import re
 import io
+import hashlib
+import pypdfium2 as pdfium
 from pypdf import PdfReader
 from docx import Document
 import uvicorn
 from rapidfuzz import fuzz, process
 
+# Debug output goes through logging so it costs nothing unless LOG_LEVEL=DEBUG.
+# The handler sits on the service logger only, so library warnings (e.g. pypdf)
+# don't end up in the service logs.
+logger = logging.getLogger("cv_parser")
+_log_handler = logging.StreamHandler()
+_log_handler.setFormatter(logging.Formatter("%(levelname)s [%(name)s] %(message)s"))
+logger.addHandler(_log_handler)
+logger.propagate = False
+LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO").upper()
+if not isinstance(logging.getLevelName(LOG_LEVEL), int):
+    # Unknown level names would make setLevel() raise at import time
+    LOG_LEVEL = "INFO"
+logger.setLevel(LOG_LEVEL)
+
 # Global skills list for easier maintenance and fuzzy matching
 SKILLS_LIST = [
     'python', 'java', 'javascript', 'typescript', 'react', 'node.js', 'nodejs',
@@ -44,10 +71,175 @@ SKILL_ALIASES = {
     'tf': 'tensorflow', 'aws lambda': 'aws', 'ec2': 'aws', 's3': 'aws'
 }
 
+# Keywords used by name extraction
+SKIP_KEYWORDS = frozenset({
+    'curriculum', 'vitae', 'resume', 'cv', 'contact', 'profile',
+    'about', 'summary', 'objective', 'experience', 'education', 'skills'
+})
+JOB_TITLE_KEYWORDS = frozenset({
+    'analyst', 'developer', 'engineer', 'manager', 'director', 'consultant',
+    'specialist', 'senior', 'junior', 'lead', 'architect', 'admin', 'officer',
+    'data', 'product', 'designer', 'coordinator', 'executive', 'intern', 'trainee'
+})
+NAME_CONNECTORS = frozenset({'bin', 'al', 'de', 'van', 'von', 'der', 'el', 'la', 'ibn'})
+# Characters a name word can't contain (numbers or special chars, except hyphens)
+NAME_INVALID_CHAR_PATTERN = re.compile(r'[0-9@#$%^&*()+=\[\]{}|\\/<>]')
+# Contact-looking content on a candidate name line: a phone-like number or a long digit run
+CONTACT_NUMBER_PATTERN = re.compile(r'\+?\d[\d\s\-().]{7,}')
+LONG_DIGIT_PATTERN = re.compile(r'\d{5,}')
+DIGIT_PATTERN = re.compile(r'\d')
+
+# Keywords used by the line-based education fallback
+DEGREE_KEYWORDS = frozenset({'bachelor', 'master', 'phd', 'doctorate', 'bsc', 'msc', 'mba', 'degree in'})
+EDUCATION_HEADERS = frozenset({'education', 'education history', 'academic background'})
+
+
+def _substring_pattern(keywords) -> re.Pattern:
+    """Compile keywords into one alternation; .search() is equivalent to any(k in s for k in keywords)."""
+    return re.compile('|'.join(re.escape(k) for k in sorted(keywords)))
+
+
+SKIP_KEYWORD_PATTERN = _substring_pattern(SKIP_KEYWORDS)
+JOB_TITLE_PATTERN = _substring_pattern(JOB_TITLE_KEYWORDS)
+# Either kind of keyword disqualifies a name line, so check both in one scan
+NAME_REJECT_PATTERN = _substring_pattern(SKIP_KEYWORDS | JOB_TITLE_KEYWORDS)
+DEGREE_KEYWORD_PATTERN = _substring_pattern(DEGREE_KEYWORDS)
+
+# PDF text backend: 'pdfium' (native PDFium, pypdf as fallback) or 'pypdf' to force the pure-Python reader
+PDF_BACKEND = os.getenv("PDF_BACKEND", "pdfium").lower()
+
+# Stop reading PDF pages once this much text is extracted (~10 resume pages); the
+# extractors only need the first sections, and long attached portfolios cost seconds
+MAX_PARSE_CHARS = 50_000
+
+
+def _env_positive_int(name: str, default: int) -> int:
+    """Read a positive integer setting from the environment, falling back to default."""
+    value = os.getenv(name, "").strip()
+    # Empty counts as unset, e.g. PARSE_WORKERS=${PARSE_WORKERS:-} from docker-compose
+    if not value:
+        return default
+    try:
+        number = int(value)
+    except ValueError:
+        number = 0
+    if number <= 0:
+        # Like LOG_LEVEL, a bad value shouldn't keep the service from starting
+        logger.warning("Invalid %s=%r, using %d", name, value, default)
+        return default
+    return number
+
+
+# Uploads larger than this are rejected with 413; read in chunks so an oversized
+# file is never held in memory in full
+MAX_UPLOAD_BYTES = _env_positive_int("MAX_UPLOAD_BYTES", 10 * 1024 * 1024)
+UPLOAD_CHUNK_SIZE = 64 * 1024
+
+# Worker processes for CPU-bound text extraction and parsing
+PARSE_WORKERS = _env_positive_int("PARSE_WORKERS", os.cpu_count() or 1)
+
+# Skills that should keep special casing
+SPECIAL_CASE_SKILLS = {'c#', 'c++', '.net', 'ci/cd', 'ui/ux', 'nlp'}
+# Skills that need special matching (contain non-word chars)
+SPECIAL_PATTERN_SKILLS = {'c#', 'c++', '.net', 'ci/cd', 'ui/ux', 'node.js'}
+
+# Precompiled patterns - compiled once at import instead of on every request
+# Improved email pattern that handles more cases but avoids false positives
+EMAIL_PATTERN = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
+
+# Matches various phone formats including International/Bahraini
+PHONE_PATTERNS = [
+    re.compile(r'\+\d{1,4}\s?\d{6,10}'),  # International: +973 33430100
+    re.compile(r'\+\d{1,4}[-.\s]?\d{3,4}[-.\s]?\d{3,4}[-.\s]?\d{3,4}'), # Int w/ separators
+    re.compile(r'\+?\d{1,3}[-.\s]?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}'), # US/Generic
+    re.compile(r'\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}'), # Local US
+    re.compile(r'\b\d{8}\b'), # Simple 8 digit
+]
+
+# Look for patterns like "5 years experience", "5+ years", "5-7 years"
+EXP_PATTERNS = [
+    re.compile(r'(\d+)\+?\s*years?\s*(?:of)?\s*experience'),
+    re.compile(r'experience\s*[:.]?\s*(\d+)\+?\s*years?'),
+    re.compile(r'(\d+)-\d+\s*years?\s*(?:of)?\s*experience'),
+]
+
+# More robust patterns to capture the full line including "Bachelor of X in Y"
+DEGREE_PATTERNS = [
+    # Pattern 1: Bachelor's Degree in X, University of Y
+    # Handles smart quotes (’) and straight quotes (')
+    # Allows commas in the middle (for "Database Systems, Bahrain Polytechnic")
+    # Added 'polytechnic' to institution list
+    # The gap before the institution is bounded: normalized text is a single line, so an
+    # unbounded run backtracks over the rest of the document for every candidate start
+    # (quadratic). Matches longer than 100 chars are discarded anyway.
+    re.compile(r"(?:(?:bachelor|master|doctor)(?:['’]?s?)?|b\.?s\.?|m\.?s\.?|b\.?a\.?|m\.?a\.?|mba|ph\.?d\.?)\s+(?:degree\s+)?(?:of|in)?\s+[\w\s&,-]{1,200}(?:university|college|institute|school|polytechnic)[\w\s,-]*", re.IGNORECASE),
+
+    # Pattern 2: Bachelor's Degree in X (without explicit university keyword)
+    re.compile(r"(?:bachelor|master|doctor)(?:['’]?s?)?\s+(?:degree\s+)?(?:of|in)\s+[\w\s&,-]+", re.IGNORECASE),
+
+    # Pattern 3: B.S. in X
+    re.compile(r"(?:b\.?s\.?|m\.?s\.?|b\.?a\.?|m\.?a\.?)\s+in\s+[\w\s&,-]+", re.IGNORECASE),
+]
+
+# Literals each degree pattern can't match without (at least one must occur in the text).
+# Checking them with plain substring search lets us skip a full regex scan on most CVs;
+# None means the pattern has no selective literal and always runs
+DEGREE_REQUIRED_LITERALS = [
+    ('university', 'college', 'institute', 'school', 'polytechnic'),
+    ('bachelor', 'master', 'doctor'),
+    None,
+]
+
+
+def format_skill(skill: str) -> str:
+    """Format skill with proper casing."""
+    if skill.lower() in SPECIAL_CASE_SKILLS:
+        return skill.upper() if skill.lower() in {'nlp'} else skill
+    return skill.title()
+
+
+# Display name for every canonical skill, computed once instead of per match
+SKILL_TITLE = {skill: format_skill(skill) for skill in SKILLS_LIST}
+# Display name for every alias, so alias hits are a single dict lookup
+ALIAS_TITLE = {alias: SKILL_TITLE[skill] for alias, skill in SKILL_ALIASES.items()}
+
+# Single alternation over all word-boundary skills so the text is scanned once.
+# Longer skills come first so e.g. 'golang' is preferred over 'go' at the same position.
+SKILL_PATTERN = re.compile(
+    r'\b(?:'
+    + '|'.join(re.escape(skill) for skill in sorted(
+        (s for s in SKILLS_LIST if s not in SPECIAL_PATTERN_SKILLS), key=len, reverse=True))
+    + r')\b'
+)
+
+# Candidate words for alias and fuzzy matching, and number-like tokens to skip
+WORD_TOKEN_PATTERN = re.compile(r'[a-z0-9#+./-]+')
+DIGIT_NOISE_PATTERN = re.compile(r'^[0-9./-]+$')
+
+
+def _new_parse_pool() -> ProcessPoolExecutor:
+    """Create the process pool used for CPU-bound parsing."""
+    # spawn (not fork) so workers don't inherit the server's threads and event loop
+    return ProcessPoolExecutor(
+        max_workers=PARSE_WORKERS,
+        mp_context=multiprocessing.get_context("spawn"),
+    )
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Own the process pool used for CPU-bound parsing for the lifetime of the app."""
+    app.state.pool = _new_parse_pool()
+    yield
+    app.state.pool.shutdown()
+
+
 app = FastAPI(
     title="HRFlow CV Parser",
     description="Simple OCR-based CV parser for extracting candidate information",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan
 )
 
 # CORS configuration
@@ -60,14 +252,18 @@ app.add_middleware(
 )
 
 
+class CVParseError(Exception):
+    """Raised when an uploaded file can't be read (picklable, unlike HTTPException)."""
+
+
 def normalize_text(text: str) -> str:
     """
     Normalize text from PDFs/DOCX that extract each word on a separate line.
     Joins all words together, then creates logical lines at section breaks.
     """
     # 1. Brutal whitespace cleanup: Replace ALL whitespace sequences with a single space
-    # This handles \n, \r, \t, \f, etc.
-    normalized = re.sub(r'\s+', ' ', text).strip()
+    # This handles \n, \r, \t, \f, etc. str.split() does this in C without the regex engine
+    normalized = ' '.join(text.split())
     
     parts = normalized.split('|')
     full_text = ' | '.join(parts) # Simple join for now
@@ -77,18 +273,60 @@ def normalize_text(text: str) -> str:
     return full_text
 
 
+# PDFium is not thread-safe, so calls are serialized in case parses share a process
+_pdfium_lock = threading.Lock()
+
+
+def _extract_pdf_text_pdfium(file_bytes: bytes) -> str:
+    """Extract raw text from a PDF using PDFium (native, much faster than pypdf)."""
+    pdf = pdfium.PdfDocument(file_bytes)
+    try:
+        pages = []
+        total_len = 0
+        for page in pdf:
+            textpage = page.get_textpage()
+            pages.append(textpage.get_text_bounded())
+            textpage.close()
+            page.close()
+            total_len += len(pages[-1])
+            if total_len > MAX_PARSE_CHARS:
+                break
+        return "\n".join(pages)
+    finally:
+        pdf.close()
+
+
+def _extract_pdf_text_pypdf(file_bytes: bytes) -> str:
+    """Extract raw text from a PDF using pypdf."""
+    pdf_file = io.BytesIO(file_bytes)
+    reader = PdfReader(pdf_file)
+    pages = []
+    total_len = 0
+    for page in reader.pages:
+        # extract_text() can return None for pages without a text layer
+        pages.append(page.extract_text() or "")
+        total_len += len(pages[-1])
+        if total_len > MAX_PARSE_CHARS:
+            break
+    return "\n".join(pages)
+
+
 def extract_text_from_pdf(file_bytes: bytes) -> str:
     """Extract text from PDF file."""
     try:
-        pdf_file = io.BytesIO(file_bytes)
-        reader = PdfReader(pdf_file)
-        text = ""
-        for page in reader.pages:
-            text += page.extract_text() + "\n"
+        if PDF_BACKEND == "pypdf":
+            text = _extract_pdf_text_pypdf(file_bytes)
+        else:
+            try:
+                with _pdfium_lock:
+                    text = _extract_pdf_text_pdfium(file_bytes)
+            except Exception:
+                # Fall back to pypdf for files PDFium can't open
+                text = _extract_pdf_text_pypdf(file_bytes)
         # Normalize the text to handle word-per-line PDFs
         return normalize_text(text)
     except Exception as e:
-        raise HTTPException(status_code=400, detail=f"Failed to parse PDF: {str(e)}")
+        raise CVParseError(f"Failed to parse PDF: {str(e)}")
 
 
 def extract_text_from_docx(file_bytes: bytes) -> str:
@@ -96,128 +334,102 @@ def extract_text_from_docx(file_bytes: bytes) -> str:
     try:
         docx_file = io.BytesIO(file_bytes)
         doc = Document(docx_file)
-        text = ""
-        for paragraph in doc.paragraphs:
-            text += paragraph.text + "\n"
-        
+        text = "\n".join(paragraph.text for paragraph in doc.paragraphs)
+
         # Apply normalization to DOCX as well to ensure consistent extraction
         return normalize_text(text)
     except Exception as e:
-        raise HTTPException(status_code=400, detail=f"Failed to parse DOCX: {str(e)}")
+        raise CVParseError(f"Failed to parse DOCX: {str(e)}")
 
 
 def extract_email(text: str) -> Optional[str]:
     """Extract email from text."""
-    # Improved pattern that handles more cases but avoids false positives
-    email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-    match = re.search(email_pattern, text)
+    match = EMAIL_PATTERN.search(text)
     return match.group(0) if match else None
 
 
 def extract_phone(text: str) -> Optional[str]:
     """Extract phone number from text."""
-    # Matches various phone formats including International/Bahraini
-    phone_patterns = [
-        r'\+\d{1,4}\s?\d{6,10}',  # International: +973 33430100
-        r'\+\d{1,4}[-.\s]?\d{3,4}[-.\s]?\d{3,4}[-.\s]?\d{3,4}', # Int w/ separators
-        r'\+?\d{1,3}[-.\s]?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}', # US/Generic
-        r'\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}', # Local US
-        r'\b\d{8}\b', # Simple 8 digit
-    ]
-    for pattern in phone_patterns:
-        match = re.search(pattern, text)
+    for pattern in PHONE_PATTERNS:
+        match = pattern.search(text)
         if match:
             return match.group(0)
     return None
 
 
+def _is_name_line(line: str, line_lower: str) -> bool:
+    """Check if a whole line looks like a name (2-5 properly capitalized words)."""
+    # Cheap length and word-count checks first; they reject most lines before any regex runs
+    # Skip lines that are too long (likely descriptions)
+    if len(line) > 50:
+        return False
+    words = line.split()
+    if not 2 <= len(words) <= 5:
+        return False
+
+    # Skip headers, section titles and job titles
+    if NAME_REJECT_PATTERN.search(line_lower):
+        return False
+    # Skip lines with contact info
+    if '@' in line or LONG_DIGIT_PATTERN.search(line):
+        return False
+    # Words shouldn't contain numbers or special chars (except hyphens).
+    # Checked once over the whole line rather than word by word
+    if NAME_INVALID_CHAR_PATTERN.search(line):
+        return False
+    # Each word should start with uppercase OR be a connector
+    return all(w[0].isupper() or w.lower() in NAME_CONNECTORS for w in words)
+
+
 def extract_name(text: str) -> Optional[str]:
     """
     Extract name from text using positional heuristics.
     Names typically appear BEFORE contact info (email/phone).
     """
     # Split text into lines, handling both newlines and pipe separators
-    lines = [l.strip() for l in text.replace('|', '\n').split('\n') if l.strip()]
+    lines = [s for l in text.replace('|', '\n').split('\n') if (s := l.strip())]
 
-    print(f"[DEBUG] Name extraction - total lines: {len(lines)}")
+    logger.debug("Name extraction - total lines: %d", len(lines))
     if lines:
-        print(f"[DEBUG] First line: {lines[0][:80]}")
-
-    skip_keywords = ['curriculum', 'vitae', 'resume', 'cv', 'contact', 'profile',
-                     'about', 'summary', 'objective', 'experience', 'education', 'skills']
-    job_title_keywords = [
-        'analyst', 'developer', 'engineer', 'manager', 'director', 'consultant',
-        'specialist', 'senior', 'junior', 'lead', 'architect', 'admin', 'officer',
-        'data', 'product', 'designer', 'coordinator', 'executive', 'intern', 'trainee'
-    ]
-    name_connectors = ['bin', 'al', 'de', 'van', 'von', 'der', 'el', 'la', 'ibn']
+        logger.debug("First line: %.80s", lines[0])
 
     # STRATEGY 1: Find contact info position and look for name ABOVE it
     contact_idx = len(lines)
     for i, line in enumerate(lines):
-        line_lower = line.lower()
         # Check for email or phone number
-        if '@' in line or re.search(r'\+?\d[\d\s\-().]{7,}', line):
+        if '@' in line or CONTACT_NUMBER_PATTERN.search(line):
             contact_idx = i
-            print(f"[DEBUG] Contact info found at line {i}: {line[:50]}")
+            logger.debug("Contact info found at line %d: %.50s", i, line)
             break
 
     # Search lines before contact info
     search_lines = lines[:contact_idx] if contact_idx > 0 else lines[:5]
 
-    for line in search_lines:
-        line_lower = line.lower()
+    # Every strategy only looks at the head of the CV; lowercase it once for all of them
+    head_lower = [line.lower() for line in lines[:max(len(search_lines), 4)]]
 
-        # Skip headers and section titles
-        if any(skip in line_lower for skip in skip_keywords):
-            continue
-        # Skip job titles
-        if any(title in line_lower for title in job_title_keywords):
-            continue
-        # Skip lines with contact info
-        if '@' in line or re.search(r'\d{5,}', line):
-            continue
-        # Skip lines that are too long (likely descriptions)
-        if len(line) > 50:
-            continue
-
-        # Check if line looks like a name (2-5 words, properly capitalized)
-        words = line.split()
-        if 2 <= len(words) <= 5:
-            is_valid_name = True
-            for w in words:
-                if not w:
-                    continue
-                # Word should start with uppercase OR be a connector
-                if not (w[0].isupper() or w.lower() in name_connectors):
-                    is_valid_name = False
-                    break
-                # Word shouldn't contain numbers or special chars (except hyphens)
-                if re.search(r'[0-9@#$%^&*()+=\[\]{}|\\/<>]', w):
-                    is_valid_name = False
-                    break
-
-            if is_valid_name:
-                print(f"[DEBUG] Name found via positional heuristic: {line}")
-                return line
+    for line, line_lower in zip(search_lines, head_lower):
+        if _is_name_line(line, line_lower):
+            logger.debug("Name found via positional heuristic: %s", line)
+            return line
 
     # STRATEGY 2: Original first-chunk analysis
     first_chunk = lines[0] if lines else ""
 
     # Skip header lines
-    if any(k == first_chunk.lower() for k in skip_keywords):
+    if lines and head_lower[0] in SKIP_KEYWORDS:
         first_chunk = lines[1] if len(lines) > 1 else ""
 
     words = first_chunk.split()
     possible_name = []
 
     for word in words:
-        if any(title in word.lower() for title in job_title_keywords):
+        if JOB_TITLE_PATTERN.search(word.lower()):
             break
-        if '@' in word or re.search(r'\d', word) or '|' in word:
+        if '@' in word or DIGIT_PATTERN.search(word) or '|' in word:
             break
 
-        if word and (word[0].isupper() or word.lower() in name_connectors):
+        if word and (word[0].isupper() or word.lower() in NAME_CONNECTORS):
             possible_name.append(word)
         elif possible_name:
             break
@@ -227,10 +439,8 @@ def extract_name(text: str) -> Optional[str]:
 
     # STRATEGY 3: Merge single-word capitalized lines
     merged_name = []
-    for line in lines[:4]:
-        if not line:
-            continue
-        if ' ' not in line and line[0].isupper() and not any(k in line.lower() for k in skip_keywords):
+    for line, line_lower in zip(lines[:4], head_lower):
+        if ' ' not in line and line[0].isupper() and not SKIP_KEYWORD_PATTERN.search(line_lower):
             merged_name.append(line)
         else:
             break
@@ -241,116 +451,98 @@ def extract_name(text: str) -> Optional[str]:
     # STRATEGY 4: Last resort - first reasonable line
     if lines:
         first_line = lines[0]
-        if 3 < len(first_line) < 30 and not any(k in first_line.lower() for k in skip_keywords):
+        if 3 < len(first_line) < 30 and not SKIP_KEYWORD_PATTERN.search(head_lower[0]):
             return first_line
 
     return None
 
 
-def extract_skills(text: str) -> List[str]:
-    """Extract skills from text using exact and fuzzy matching."""
-    text_lower = text.lower()
-    found_skills = set()
+@lru_cache(maxsize=None)
+def _fuzzy_candidates(length: int) -> Tuple[str, ...]:
+    """Skills whose length leaves room for a fuzz.ratio >= 85 against a word of this length."""
+    # ratio = 100 * (1 - indel / (len1 + len2)) and indel >= the length difference
+    return tuple(
+        skill for skill in SKILLS_LIST
+        if 100 * abs(len(skill) - length) <= 15 * (len(skill) + length)
+    )
 
-    # Skills that should keep special casing
-    special_case_skills = {'c#', 'c++', '.net', 'ci/cd', 'ui/ux', 'nlp'}
-    # Skills that need special matching (contain non-word chars)
-    special_pattern_skills = {'c#', 'c++', '.net', 'ci/cd', 'ui/ux', 'node.js'}
 
-    def format_skill(skill: str) -> str:
-        """Format skill with proper casing."""
-        if skill.lower() in special_case_skills:
-            return skill.upper() if skill.lower() in {'nlp'} else skill
-        return skill.title()
+@lru_cache(maxsize=8192)
+def _fuzzy_skill_match(word: str) -> Optional[Tuple[str, float]]:
+    """Closest skill to a word by fuzzy ratio; memoized since CV vocabularies overlap heavily."""
+    candidates = _fuzzy_candidates(len(word))
+    if not candidates:
+        return None
+    match = process.extractOne(
+        word,
+        candidates,
+        scorer=fuzz.ratio,
+        score_cutoff=85  # Conservative threshold to avoid false positives
+    )
+    return (match[0], match[1]) if match else None
+
+
+def extract_skills(text: str, text_lower: Optional[str] = None) -> List[str]:
+    """Extract skills from text using exact and fuzzy matching."""
+    if text_lower is None:
+        text_lower = text.lower()
+    found_skills = set()
 
     # 1. Check aliases first (exact match on common abbreviations)
-    words = re.findall(r'[a-z0-9#+./-]+', text_lower)
-    for word in words:
-        if word in SKILL_ALIASES:
-            canonical = SKILL_ALIASES[word]
-            found_skills.add(format_skill(canonical))
+    # Each distinct word only needs checking once, here and in the fuzzy pass
+    words = set(WORD_TOKEN_PATTERN.findall(text_lower))
+    found_skills.update(ALIAS_TITLE[word] for word in words.intersection(ALIAS_TITLE))
 
     # 2. Handle special pattern skills (c#, c++, .net, etc.) with direct search
-    for skill in special_pattern_skills:
-        if skill.lower() in text_lower:
-            found_skills.add(format_skill(skill))
+    found_skills.update({SKILL_TITLE[skill] for skill in SPECIAL_PATTERN_SKILLS if skill in text_lower})
 
     # 3. Exact matches using word boundaries (fast path)
-    for skill in SKILLS_LIST:
-        if skill in special_pattern_skills:
-            continue  # Already handled above
-        pattern = r'\b' + re.escape(skill.lower()) + r'\b'
-        if re.search(pattern, text_lower):
-            found_skills.add(format_skill(skill))
+    found_skills.update({SKILL_TITLE[skill] for skill in SKILL_PATTERN.findall(text_lower)})
 
     # 4. Fuzzy matching for typos (only for words not already matched)
-    matched_words = set()
-    for skill in found_skills:
-        matched_words.update(skill.lower().split())
+    matched_words = {w for skill in found_skills for w in skill.lower().split()}
 
     for word in words:
         # Skip if already matched, too short, or looks like noise
         if len(word) < 4 or word in matched_words:
             continue
-        if word.isdigit() or re.match(r'^[0-9./-]+$', word):
+        if word.isdigit() or DIGIT_NOISE_PATTERN.match(word):
             continue
 
         # Try fuzzy match against skills list
-        match = process.extractOne(
-            word,
-            SKILLS_LIST,
-            scorer=fuzz.ratio,
-            score_cutoff=85  # Conservative threshold to avoid false positives
-        )
+        match = _fuzzy_skill_match(word)
         if match:
             skill = match[0]
-            found_skills.add(format_skill(skill))
-            print(f"[DEBUG] Fuzzy matched '{word}' -> '{skill}' (score: {match[1]})")
+            found_skills.add(SKILL_TITLE[skill])
+            logger.debug("Fuzzy matched '%s' -> '%s' (score: %s)", word, skill, match[1])
 
     return list(found_skills)
 
 
-def extract_experience_years(text: str) -> Optional[int]:
+def extract_experience_years(text: str, text_lower: Optional[str] = None) -> Optional[int]:
     """Extract years of experience from text."""
-    # Look for patterns like "5 years experience", "5+ years", "5-7 years"
-    patterns = [
-        r'(\d+)\+?\s*years?\s*(?:of)?\s*experience',
-        r'experience\s*[:.]?\s*(\d+)\+?\s*years?',
-        r'(\d+)-\d+\s*years?\s*(?:of)?\s*experience'
-    ]
-
-    for pattern in patterns:
-        match = re.search(pattern, text.lower())
+    if text_lower is None:
+        text_lower = text.lower()
+    for pattern in EXP_PATTERNS:
+        match = pattern.search(text_lower)
         if match:
             return int(match.group(1))
 
     return None
 
 
-def extract_education(text: str) -> List[str]:
+def extract_education(text: str, text_lower: Optional[str] = None) -> List[str]:
     """Extract education information from text - finds full degree descriptions."""
-    text_lower = text.lower()
-    
-    # More robust patterns to capture the full line including "Bachelor of X in Y"
-    degree_patterns = [
-        # Pattern 1: Bachelor's Degree in X, University of Y
-        # Handles smart quotes (’) and straight quotes (')
-        # Allows commas in the middle (for "Database Systems, Bahrain Polytechnic")
-        # Added 'polytechnic' to institution list
-        r"(?:(?:bachelor|master|doctor)(?:['’]?s?)?|b\.?s\.?|m\.?s\.?|b\.?a\.?|m\.?a\.?|mba|ph\.?d\.?)\s+(?:degree\s+)?(?:of|in)?\s+[\w\s&,-]+(?:university|college|institute|school|polytechnic)[\w\s,-]*",
-        
-        # Pattern 2: Bachelor's Degree in X (without explicit university keyword)
-        r"(?:bachelor|master|doctor)(?:['’]?s?)?\s+(?:degree\s+)?(?:of|in)\s+[\w\s&,-]+",
-        
-        # Pattern 3: B.S. in X
-        r"(?:b\.?s\.?|m\.?s\.?|b\.?a\.?|m\.?a\.?)\s+in\s+[\w\s&,-]+",
-    ]
+    if text_lower is None:
+        text_lower = text.lower()
     
     degrees = []
     
     # 1. Try regex patterns on the whole text
-    for pattern in degree_patterns:
-        matches = re.finditer(pattern, text_lower, re.IGNORECASE)
+    for pattern, literals in zip(DEGREE_PATTERNS, DEGREE_REQUIRED_LITERALS):
+        if literals and not any(literal in text_lower for literal in literals):
+            continue
+        matches = pattern.finditer(text_lower)
         for match in matches:
             # Get original text case if possible, but we are searching lower
             # We'll just capitalize the match result
@@ -359,14 +551,13 @@ def extract_education(text: str) -> List[str]:
             # Filter out false positives that are too long or too short
             if 10 < len(match_text) < 100:
                  # Clean up newlines in the match
-                clean_match = re.sub(r'\s+', ' ', match_text)
+                clean_match = ' '.join(match_text.split())
                 degrees.append(clean_match)
-    
+
     # 2. Fallback: Line-based search (especially after normalization provided structure)
     if not degrees:
         lines = text.split('\n')
-        degree_keywords = ['bachelor', 'master', 'phd', 'doctorate', 'bsc', 'msc', 'mba', 'degree in']
-        
+
         for line in lines:
             line_clean = line.strip()
             line_lower = line_clean.lower()
@@ -374,9 +565,9 @@ def extract_education(text: str) -> List[str]:
             if len(line_clean) < 10 or len(line_clean) > 150:
                 continue
                 
-            if any(k in line_lower for k in degree_keywords):
+            if DEGREE_KEYWORD_PATTERN.search(line_lower):
                 # Avoid headers like "Education" alone
-                if line_lower in ['education', 'education history', 'academic background']:
+                if line_lower in EDUCATION_HEADERS:
                     continue
                 degrees.append(line_clean)
     
@@ -384,6 +575,7 @@ def extract_education(text: str) -> List[str]:
     # if one string is contained in another, keep the longer one
     # if they are very similar, keep one
     
+    # Kept entries as (degree, lowercase, word set) so each is only tokenized once
     unique_degrees = []
     # Sort by length descending to prioritize longer descriptions
     degrees.sort(key=len, reverse=True)
@@ -391,10 +583,9 @@ def extract_education(text: str) -> List[str]:
     for d in degrees:
         is_duplicate = False
         d_lower = d.lower()
+        d_words = frozenset(d_lower.split())
         
-        for unique in unique_degrees:
-            unique_lower = unique.lower()
-            
+        for unique, unique_lower, u_words in unique_degrees:
             # Check for substring match
             if d_lower in unique_lower:
                 is_duplicate = True
@@ -402,35 +593,87 @@ def extract_education(text: str) -> List[str]:
             
             # Check for high similarity (if one is just slightly different)
             # Simple Jaccard similarity on words
-            d_words = set(d_lower.split())
-            u_words = set(unique_lower.split())
-            intersection = d_words.intersection(u_words)
             if not d_words or not u_words: continue
             
-            similarity = len(intersection) / len(u_words)
+            similarity = len(d_words & u_words) / len(u_words)
             if similarity > 0.6: # If 60% of words in the new entry are already in an existing entry
                  is_duplicate = True
                  break
 
         if not is_duplicate:
-            unique_degrees.append(d)
+            unique_degrees.append((d, d_lower, d_words))
+            # Only the top 3 are returned, later candidates can't change them
+            if len(unique_degrees) == 3:
+                break
     
-    return unique_degrees[:3]
+    return [d for d, _, _ in unique_degrees]
 
 
 def parse_cv_text(text: str) -> Dict[str, Any]:
     """Parse CV text and extract structured information."""
+    # Lowercase once and share it instead of each extractor allocating its own copy
+    text_lower = text.lower()
     return {
         "name": extract_name(text),
         "email": extract_email(text),
         "phone": extract_phone(text),
-        "skills": extract_skills(text),
-        "experience_years": extract_experience_years(text),
-        "education": extract_education(text),
+        "skills": extract_skills(text, text_lower),
+        "experience_years": extract_experience_years(text, text_lower),
+        "education": extract_education(text, text_lower),
         "raw_text": text[:500]  # First 500 chars for debugging
     }
 
 
+# Parsed results keyed by a digest of the uploaded bytes, so resubmitted CVs skip parsing
+PARSE_CACHE_SIZE = 1024
+_parse_cache: "OrderedDict[bytes, Dict[str, Any]]" = OrderedDict()
+_parse_cache_lock = threading.Lock()
+
+
+def _cache_key(content: bytes, is_pdf: bool) -> bytes:
+    """Digest of the uploaded bytes plus file type."""
+    return hashlib.blake2b(content, digest_size=16).digest() + (b'p' if is_pdf else b'd')
+
+
+def _cache_get(key: bytes) -> Optional[Dict[str, Any]]:
+    """Return the cached parse result for key, marking it most recently used."""
+    with _parse_cache_lock:
+        cached = _parse_cache.get(key)
+        if cached is not None:
+            _parse_cache.move_to_end(key)
+        return cached
+
+
+def _cache_put(key: bytes, parsed_data: Dict[str, Any]) -> None:
+    """Store a parse result, evicting the least recently used entry when full."""
+    with _parse_cache_lock:
+        _parse_cache[key] = parsed_data
+        if len(_parse_cache) > PARSE_CACHE_SIZE:
+            _parse_cache.popitem(last=False)
+
+
+def parse_cv_file(content: bytes, is_pdf: bool) -> Dict[str, Any]:
+    """Extract text from a PDF/DOCX file and parse it. Module-level so the process pool can run it."""
+    # Extract text based on file type
+    if is_pdf:
+        text = extract_text_from_pdf(content)
+    else:  # .docx
+        text = extract_text_from_docx(content)
+
+    return parse_cv_text(text)
+
+
+async def parse_cv_cached(content: bytes, is_pdf: bool, executor: Executor) -> Dict[str, Any]:
+    """Parse a CV file on executor, reusing the cached result for identical uploads."""
+    key = _cache_key(content, is_pdf)
+    parsed_data = _cache_get(key)
+    if parsed_data is None:
+        loop = asyncio.get_running_loop()
+        parsed_data = await loop.run_in_executor(executor, parse_cv_file, content, is_pdf)
+        _cache_put(key, parsed_data)
+    return parsed_data
+
+
 @app.get("/")
 async def root():
     """Health check endpoint."""
@@ -469,27 +712,54 @@ async def parse_cv(
                 detail="Only PDF and DOCX files are supported"
             )
 
-        # Read file content
-        content = await file.read()
-
-        # Extract text based on file type
-        if filename.endswith('.pdf'):
-            text = extract_text_from_pdf(content)
-        else:  # .docx
-            text = extract_text_from_docx(content)
-
-        # Parse extracted text
-        parsed_data = parse_cv_text(text)
+        too_large = HTTPException(
+            status_code=413,
+            detail=f"File too large (max {MAX_UPLOAD_BYTES} bytes)"
+        )
+        # The multipart parser has already spooled the upload and knows its size,
+        # so most oversized files are rejected without reading a single byte
+        if file.size is not None and file.size > MAX_UPLOAD_BYTES:
+            raise too_large
+
+        # Read file content in chunks, rejecting oversized uploads early
+        buf = bytearray()
+        while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+            buf.extend(chunk)
+            if len(buf) > MAX_UPLOAD_BYTES:
+                raise too_large
+        content = bytes(buf)
+
+        # Extract and parse (cached by content hash). Cache misses run in the process
+        # pool so the event loop stays free and CVs are parsed on all cores
+        is_pdf = filename.endswith('.pdf')
+        pool = app.state.pool
+        try:
+            parsed_data = await parse_cv_cached(content, is_pdf, pool)
+        except CVParseError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        except BrokenProcessPool:
+            # A worker died mid-parse (e.g. crashed in a native PDF library); the pool
+            # refuses all further work, so swap in a new one for the next requests
+            logger.error("Parser worker died while parsing %s; restarting the pool", file.filename)
+            if app.state.pool is pool:
+                app.state.pool = _new_parse_pool()
+                pool.shutdown(wait=False)
+            raise HTTPException(
+                status_code=500,
+                detail="Parser worker crashed while processing the file"
+            )
         
-        # Debug: Print parsed data
-        print(f"\n{'='*50}")
-        print(f"[CV Parser] Parsed CV: {file.filename}")
-        print(f"  Name: {parsed_data.get('name')}")
-        print(f"  Email: {parsed_data.get('email')}")
-        print(f"  Phone: {parsed_data.get('phone')}")
-        print(f"  Skills: {len(parsed_data.get('skills', []))} found")
-        print(f"  Education: {parsed_data.get('education')}")
-        print(f"{'='*50}\n")
+        # Debug: Log parsed data (arguments are only gathered when debug logging is on)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Parsed CV: %s | Name: %s | Email: %s | Phone: %s | Skills: %d found | Education: %s",
+                file.filename,
+                parsed_data.get('name'),
+                parsed_data.get('email'),
+                parsed_data.get('phone'),
+                len(parsed_data.get('skills', [])),
+                parsed_data.get('education'),
+            )
 
         return {
             "success": True,
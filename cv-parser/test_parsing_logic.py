@@ -1,11 +1,21 @@
 """
 Tests for CV parsing improvements.
+Install test dependencies with: pip install -r requirements-dev.txt
 Run with: python -m pytest test_parsing_logic.py -v
 Or simply: python test_parsing_logic.py
 """
 
+import asyncio
+import io
+import os
 import sys
-from main import extract_skills, extract_name, extract_education
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from docx import Document
+from fastapi import HTTPException, UploadFile
+from fastapi.testclient import TestClient
+import main
+from main import app, extract_skills, extract_name, extract_education, parse_cv_cached
 
 
 class TestFuzzySkillMatching:
@@ -157,6 +167,121 @@ class TestEducationExtraction:
         # Should find at least one education entry
         assert len(education) >= 1
 
+    def test_repeated_degree_does_not_hide_others(self):
+        """Test that a degree repeated several times doesn't crowd out a later one."""
+        bachelor = "Bachelor of Science in Computer Science, University of Bahrain"
+        text = f"{bachelor} | {bachelor} | {bachelor} | Master of Science in Data Analytics"
+        education = extract_education(text)
+        assert any("bachelor" in e.lower() for e in education)
+        assert "Master of Science in Data Analytics" in education
+
+
+def make_docx(*paragraphs):
+    """Build an in-memory DOCX file from the given paragraphs."""
+    doc = Document()
+    for paragraph in paragraphs:
+        doc.add_paragraph(paragraph)
+    buf = io.BytesIO()
+    doc.save(buf)
+    return buf.getvalue()
+
+
+def parse_cached(content, is_pdf):
+    """Run parse_cv_cached to completion on a thread pool."""
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return asyncio.run(parse_cv_cached(content, is_pdf, executor))
+
+
+class TestParseCache:
+    """Test caching of parsed CVs by file content."""
+
+    def test_identical_upload_is_cached(self):
+        """Test that re-uploading the same file returns the cached result."""
+        content = make_docx("Jane Doe", "jane@email.com", "Skills: Python, Docker")
+        first = parse_cached(content, is_pdf=False)
+        second = parse_cached(content, is_pdf=False)
+        assert first is second
+        assert first["email"] == "jane@email.com"
+
+    def test_different_upload_is_parsed(self):
+        """Test that a different file is not served from the cache."""
+        first = parse_cached(make_docx("Jane Doe", "jane@email.com"), is_pdf=False)
+        second = parse_cached(make_docx("John Smith", "john@email.com"), is_pdf=False)
+        assert first is not second
+        assert second["email"] == "john@email.com"
+
+
+class TestParseEndpoint:
+    """Test the /parse endpoint."""
+
+    def test_oversized_upload_is_rejected(self):
+        """Test that an upload over MAX_UPLOAD_BYTES gets a 413 from its known size."""
+        content = make_docx("Jane Doe", "jane@email.com")
+        max_upload_bytes = main.MAX_UPLOAD_BYTES
+        main.MAX_UPLOAD_BYTES = len(content) - 1
+        try:
+            with TestClient(app) as client:
+                response = client.post("/parse", files={"file": ("cv.docx", content)})
+        finally:
+            main.MAX_UPLOAD_BYTES = max_upload_bytes
+        assert response.status_code == 413
+        assert response.json()["detail"] == f"File too large (max {len(content) - 1} bytes)"
+
+    def test_oversized_upload_without_size_is_rejected(self):
+        """Test that an upload of unknown size gets a 413 once reading passes the limit."""
+        content = make_docx("Jane Doe", "jane@email.com")
+        upload = UploadFile(io.BytesIO(content), filename="cv.docx")
+        assert upload.size is None
+        max_upload_bytes = main.MAX_UPLOAD_BYTES
+        main.MAX_UPLOAD_BYTES = len(content) - 1
+        try:
+            asyncio.run(main.parse_cv(file=upload, url=None))
+            raise AssertionError("Expected a 413 for the oversized upload")
+        except HTTPException as e:
+            assert e.status_code == 413
+        finally:
+            main.MAX_UPLOAD_BYTES = max_upload_bytes
+
+    def test_crashed_worker_pool_is_replaced(self):
+        """Test that a dead parser worker fails one request, not every later one."""
+        content = make_docx("Jane Doe", "jane.endpoint@email.com")
+        with TestClient(app) as client:
+            broken_pool = app.state.pool
+            try:
+                broken_pool.submit(os._exit, 1).result()
+            except BrokenProcessPool:
+                pass
+
+            response = client.post("/parse", files={"file": ("cv.docx", content)})
+            assert response.status_code == 500
+            assert app.state.pool is not broken_pool
+
+            response = client.post("/parse", files={"file": ("cv.docx", content)})
+            assert response.status_code == 200
+            assert response.json()["data"]["email"] == "jane.endpoint@email.com"
+
+
+class TestEnvSettings:
+    """Test reading settings from environment variables."""
+
+    def test_invalid_positive_int_uses_default(self):
+        """Test that empty, non-numeric and non-positive values fall back to the default."""
+        for value in ("", "lots", "0", "-5"):
+            os.environ["CV_PARSER_TEST_SETTING"] = value
+            try:
+                assert main._env_positive_int("CV_PARSER_TEST_SETTING", 7) == 7
+            finally:
+                del os.environ["CV_PARSER_TEST_SETTING"]
+
+    def test_valid_positive_int_is_used(self):
+        """Test that a positive integer value is used as is."""
+        os.environ["CV_PARSER_TEST_SETTING"] = "3"
+        try:
+            assert main._env_positive_int("CV_PARSER_TEST_SETTING", 7) == 3
+        finally:
+            del os.environ["CV_PARSER_TEST_SETTING"]
+        assert main._env_positive_int("CV_PARSER_TEST_SETTING", 7) == 7
+
 
 def run_tests():
     """Run all tests manually without pytest."""
@@ -164,7 +289,8 @@ def run_tests():
     failed = 0
     errors = []
 
-    test_classes = [TestFuzzySkillMatching, TestNameExtraction, TestEducationExtraction]
+    test_classes = [TestFuzzySkillMatching, TestNameExtraction, TestEducationExtraction, TestParseCache,
+                    TestParseEndpoint, TestEnvSettings]
 
     for test_class in test_classes:
         instance = test_class()